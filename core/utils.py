@@ -28,7 +28,7 @@ import logging
 import datetime
 import colorsys
 from enum import Enum, auto
-from typing import Any, Optional, Dict, List, TYPE_CHECKING
+from typing import Any, Optional, Dict, List, Tuple, TYPE_CHECKING
 from core import connection
 if TYPE_CHECKING:
     # Fix circular imports needed for the type checker
@@ -447,6 +447,9 @@ class ColorHSV():
     C_HUE = 'Hue'
     C_SAT = 'Saturation'
     C_VAL = 'Value'
+    # HSV to RGB conversion: indexes into (value, p, q, t) for red, green, blue
+    # for every 60° sector of the hue, same as the if-chain in colorsys.hsv_to_rgb()
+    _HSV_SECTOR_TO_RGB = ((0, 3, 1), (2, 0, 1), (1, 0, 3), (1, 2, 0), (3, 1, 0), (0, 1, 2))
 
     def __init__(self,
                  RGBW_dict:Dict[str, int],
@@ -492,6 +495,15 @@ class ColorHSV():
             return NotImplemented
         return self._hsv == other_obj.hsv_dict
 
+    def clone(self) -> 'ColorHSV':
+        ''' Returns an independent copy of this color,
+            a lot faster than copy.deepcopy() since only the HSV dictionary needs to be copied
+        '''
+        new = ColorHSV.__new__(ColorHSV)
+        new._hsv = self._hsv.copy()
+        new.use_white_ch = self.use_white_ch
+        return new
+
     @property
     def rgbw_dict(self) -> Dict[str, int]:
         ''' Get or set color as RGBW dictionary
@@ -504,27 +516,7 @@ class ColorHSV():
             If colors are not present in the dictionary when writing
             to this property the value is assumed to be 0
         '''
-        # create empty RGBW dict
-        rgbw_dict = {}
-        for key in self.C_RGBW_ARRAY:
-            rgbw_dict[key] = 0
-
-        # Check if saturation (hsv_array[1]) equals 0 then set RGB = 0 w = value (hsv_array)
-        if self._hsv[self.C_SAT] == 0 and self.use_white_ch:
-            # set white channel to saturation
-            rgbw_dict[self.C_WHITE] = self._hsv[self.C_VAL]
-        else:
-            # Convert HSV color to RGB color tuple
-            color_rgb = colorsys.hsv_to_rgb(self._hsv[self.C_HUE]/360,
-                                            self._hsv[self.C_SAT]/100,
-                                            self._hsv[self.C_VAL]/100)
-            # Set white channel to 0
-            color_rgbw = color_rgb + (0,)
-            # store converted values
-            for (key, val) in zip(self.C_RGBW_ARRAY, color_rgbw):
-                rgbw_dict[key] = round(val * 100)
-
-        return rgbw_dict
+        return dict(zip(self.C_RGBW_ARRAY, self.get_rgbw_all()))
 
     @rgbw_dict.setter
     def rgbw_dict(self,
@@ -575,15 +567,11 @@ class ColorHSV():
     @color_hsv_str.setter
     def color_hsv_str(self,
                       hsv_str:str) -> None:
-        hsv_array = []
         # We expect a string with 3 values: hue,saturation,value
-        # Split and convert them to integer
-        for val in hsv_str.split(","):
-            hsv_array.append(int(val))
-
-        self._hsv[self.C_HUE] = hsv_array[0]
-        self._hsv[self.C_SAT] = hsv_array[1]
-        self._hsv[self.C_VAL] = hsv_array[2]
+        # Split and convert them to integer, additional values are ignored
+        # set_hsv_all() raises an error if a value is out of range
+        hsv_array = hsv_str.split(",")
+        self.set_hsv_all(int(hsv_array[0]), int(hsv_array[1]), int(hsv_array[2]))
 
     def get_hsv(self,
                 param:str) -> int:
@@ -615,3 +603,52 @@ class ColorHSV():
         else:
             raise ValueError(f"Function 'set_hsv()' parameter 'param' has unknown value: {param}")
 
+    def get_rgbw_all(self) -> Tuple[int, int, int, int]:
+        ''' Returns the color as RGBW tuple (red, green, blue, white),
+            same order as C_RGBW_ARRAY, range 0 (= off) to 100 (= full brightness).
+            Faster than the property 'rgbw_dict' since no dictionary is created.
+        '''
+        # Check if saturation equals 0 then set RGB = 0 and white = value
+        if self._hsv[self.C_SAT] == 0 and self.use_white_ch:
+            return (0, 0, 0, self._hsv[self.C_VAL])
+        # Convert HSV color to RGB color, set white channel to 0
+        # calculation is equal to colorsys.hsv_to_rgb() but uses a lookup table
+        # instead of an if-chain to select the RGB values of the current hue sector
+        sat = self._hsv[self.C_SAT] / 100
+        val = self._hsv[self.C_VAL] / 100
+        if sat == 0:
+            return (round(val * 100), round(val * 100), round(val * 100), 0)
+        hue = self._hsv[self.C_HUE] / 360 * 6.0
+        sector = int(hue)
+        fraction = hue - sector
+        values = (val,
+                  val * (1.0 - sat),
+                  val * (1.0 - sat * fraction),
+                  val * (1.0 - sat * (1.0 - fraction)))
+        (i_red, i_green, i_blue) = self._HSV_SECTOR_TO_RGB[sector % 6]
+        return (round(values[i_red] * 100),
+                round(values[i_green] * 100),
+                round(values[i_blue] * 100), 0)
+
+    def get_hsv_all(self) -> Tuple[int, int, int]:
+        ''' Returns all HSV values as tuple: (hue, saturation, value)
+        '''
+        return (self._hsv[self.C_HUE], self._hsv[self.C_SAT], self._hsv[self.C_VAL])
+
+    def set_hsv_all(self,
+                    hue:int,
+                    sat:int,
+                    val:int) -> None:
+        ''' Sets hue, saturation and value at once (range 0 to 360/100/100).
+            Raises an error if one of the values is out of range.
+        '''
+        if hue < 0 or hue > 360:
+            raise ValueError(f"Function 'set_hsv_all()' parameter 'hue' \
+                            out of range should be 0 to 360 is: {hue}")
+        if sat < 0 or sat > 100 or val < 0 or val > 100:
+            raise ValueError(f"Function 'set_hsv_all()' parameter 'sat' or 'val' \
+                            out of range should be 0 to 100 is: {sat}, {val}")
+        self._hsv[self.C_HUE] = hue
+        self._hsv[self.C_SAT] = sat
+        self._hsv[self.C_VAL] = val
+
@@ -18,7 +18,6 @@ Classes:
 """
 from typing import Any, Dict, TYPE_CHECKING
 from types import SimpleNamespace
-from copy import deepcopy
 import yaml
 import lgpio            # https://abyz.me.uk/lg/py_lgpio.html
 from core.actuator import Actuator
@@ -86,7 +85,7 @@ class GpioColorLED(Actuator):
         white_channel_in_use = utils.ColorHSV.C_WHITE in self.pin
         self.state.current = utils.ColorHSV(dev_cfg_init_state, white_channel_in_use)
         # init last state with configured color and full brightness for toggle command
-        self.state.last = deepcopy(self.state.current)
+        self.state.last = self.state.current.clone()
         self.state.last.set_hsv(utils.ColorHSV.C_VAL, 100)
 
         # if output should be inverted, add -100 to all brightness_rgbw values
@@ -133,7 +132,7 @@ class GpioColorLED(Actuator):
             Expects comma separated values formated as HSV color: 'h,s,v'
             OR one value of: ON, OFF, TOGGLE, 0 to 100
         """
-        new_color = deepcopy(self.state.current)
+        new_color = self.state.current.clone()
         #if msg.find(',') > 0 and msg.find('NaN') == -1:
         if ',' in msg and not 'NaN' in msg:
             # msg contains ',' so it should contain a 'h,s,v' string
@@ -161,7 +160,7 @@ class GpioColorLED(Actuator):
             # invert current state on toggle command
             if self.state.current.get_hsv(utils.ColorHSV.C_VAL) > 0:
                 # remember last value for  brightness for later
-                self.state.last = deepcopy(self.state.current)
+                self.state.last = self.state.current.clone()
                 new_color.set_hsv(utils.ColorHSV.C_VAL, 0)
             else:
                 new_color = self.state.last
@@ -20,10 +20,10 @@ Classes:
     -  _SmoothDimmer  : handles smooth value change and dimming events
 """
 from types import SimpleNamespace
-from threading import Thread
-from time import sleep
-from copy import deepcopy
-from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
+from threading import Event, Lock, Thread
+from queue import Queue
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 import struct
 import yaml
 import board
@@ -35,6 +35,41 @@ if TYPE_CHECKING:
     # Fix circular imports needed for the type checker
     from core import connection
 
+# PCA9685 register address of LED0_ON_L, followed by LED0_ON_H, LED0_OFF_L, LED0_OFF_H
+# every channel uses 4 registers: LEDn_ON_L = REG_LED0_ON_L + 4 * n
+# https://cdn-shop.adafruit.com/datasheets/PCA9685.pdf
+REG_LED0_ON_L = 0x06
+# Bit 4 in LEDn_ON_H or LEDn_OFF_H switches the channel fully on or off
+PWM_FULL_ON_OFF = 0x1000
+
+# one I2C bus instance for all PwmHatColorLED, created on first use
+_i2c_bus_singleton:Optional[busio.I2C] = None
+_i2c_bus_lock = Lock()
+
+def i2c_bus() -> busio.I2C:
+    """ Use the singleton pattern to make sure only one instance of busio.I2C
+        is created even with multiple PwmHatColorLED.
+        Concurrent access is handled by the bus lock of adafruit_pca9685
+    """
+    global _i2c_bus_singleton
+    with _i2c_bus_lock:
+        if _i2c_bus_singleton is None:
+            _i2c_bus_singleton = busio.I2C(board.SCL, board.SDA)
+        return _i2c_bus_singleton
+
+def duty_cycle_to_pwm_regs(duty_cycle:int) -> Tuple[int, int]:
+    """ Converts a 16 bit duty cycle (range 0x0 to 0xffff) to the PCA9685
+        register values (ON, OFF) like adafruit_pca9685.PWMChannel.duty_cycle does
+    """
+    if duty_cycle == 0xffff:
+        # fully on
+        return (PWM_FULL_ON_OFF, 0)
+    if duty_cycle < 0x0010:
+        # fully off
+        return (0, PWM_FULL_ON_OFF)
+    # PCA9685 has only 12 bit resolution
+    return (0, duty_cycle >> 4)
+
 def scale_color_val(value:int) -> int:
     """ scale input value (range 0 to 100)
         to fit PWM HAT duty cycle (range 0x0 to 0xffff)
@@ -42,6 +77,12 @@ def scale_color_val(value:int) -> int:
     val = abs(value) / 100
     return int(val * 0xffff)
 
+# Lookup table for scale_color_val() with all possible values of
+# 'invert + color value' (range -100 to 100), use _DUTY_LUT[value + 100]
+_DUTY_LUT = tuple(scale_color_val(val) for val in range(-100, 101))
+# Same as _DUTY_LUT but contains the packed PCA9685 registers LEDn_ON_L to LEDn_OFF_H
+_PWM_REGS_LUT = tuple(struct.pack("<HH", *duty_cycle_to_pwm_regs(duty)) for duty in _DUTY_LUT)
+
 def take_radial_step(current_angle:int,
                      target_angle:int,
                      step:int) -> int:
@@ -66,9 +107,46 @@ def take_radial_step(current_angle:int,
         new -= 360
     return new
 
+def take_linear_step(current_val:int,
+                     target_val:int,
+                     step:int) -> int:
+    ''' Takes 3 decimal inputs and adds or subtracts
+        'step' from 'current_val' to get closer to 'target_val'.
+    '''
+    if abs(current_val - target_val) < step:
+        return target_val
+    if current_val < target_val:
+        return current_val + step
+    return current_val - step
+
+def step_hsv(curr_hue:int, curr_sat:int, curr_val:int,
+             target_hue:int, target_sat:int, target_val:int,
+             step:int) -> Tuple[int, int, int]:
+    ''' Takes one 'step' from the current HSV color towards the target HSV color.
+        Hue is changed in the shorter direction, e. g. value = 300, target = 4 => CCW
+        Returns the new HSV color as tuple (hue, saturation, value)
+    '''
+    return (take_radial_step(curr_hue, target_hue, step),
+            take_linear_step(curr_sat, target_sat, step),
+            take_linear_step(curr_val, target_val, step))
+
+def calc_hsv_trajectory(current:Tuple[int, int, int],
+                        target:Tuple[int, int, int],
+                        step:int) -> List[Tuple[int, int, int]]:
+    ''' Precalculates all intermediate HSV values to get from 'current' to 'target'
+        in steps of 'step'. Both parameters are tuples of (hue, saturation, value).
+        Returns a list of HSV tuples, the last item equals 'target'.
+        If current equals target an empty list is returned.
+    '''
+    trajectory = []
+    while current != target:
+        current = step_hsv(*current, *target, step)
+        trajectory.append(current)
+    return trajectory
+
 class _SmoothDimmer():
     """ Handles smooth value changes and dimming commands
-        to dim an actuator in a new thread
+        to dim an actuator in a separate worker thread
     """
 
     def __init__(self,
@@ -103,8 +181,14 @@ class _SmoothDimmer():
         self.smooth_change = SimpleNamespace(interval = None, in_progress = False)
         self.smooth_change.interval = float(caller.dev_cfg.get("SmoothChangeInterval", 0.05))
 
+        # worker thread, created on first use, receives jobs via self._jobs
         self._thread:Optional[Thread] = None
-        self._stop_thread = False
+        self._jobs:'Queue[Tuple[float, float, utils.ColorHSV, utils.ColorHSV]]' = Queue(maxsize=1)
+        # is set while the worker thread waits for a new job
+        self._idle = Event()
+        self._idle.set()
+        # is set to interrupt the current job of the worker thread
+        self._stop = Event()
 
     def apply_value_change(self,
                            value:utils.ColorHSV) -> None:
@@ -112,7 +196,7 @@ class _SmoothDimmer():
             If 'SmoothChangeInterval' is configured to > 0 the value is changed smoothly
         """
         if self.smooth_change.interval:
-            self._stop_thread = True
+            self._stop.set()
             self.smooth_change.in_progress = True
             self._start_thread(0, self.smooth_change.interval, value)
         else:
@@ -128,9 +212,9 @@ class _SmoothDimmer():
         # ignore the DIM command if smooth_change.in_progress
         if not self.smooth_change.in_progress:
             # remember current state to compare later if dimming started
-            self.dimming.state_before = deepcopy(self.caller.state.current)
+            self.dimming.state_before = self.caller.state.current.clone()
             # set value to 0 if current state > 0
-            new_color = deepcopy(self.caller.state.current)
+            new_color = self.caller.state.current.clone()
             if new_color.get_hsv(utils.ColorHSV.C_VAL):
                 new_color.set_hsv(utils.ColorHSV.C_VAL, 0)
             else:
@@ -147,15 +231,14 @@ class _SmoothDimmer():
         # make sure we don't interrupt the smooth change
         if not self.smooth_change.in_progress:
             # stop dimming thread and publish actuator state
-            self._stop_thread = True
+            self._stop.set()
             if isinstance(self._thread, Thread):
                 # Wait max. 200ms for the thread,
                 # so that local connection call doesn't get stuck here.
                 # otherwise short toggle event with local connections are not possible
-                self._thread.join(timeout=0.2)
-                # if thread is not alive = no timeout
-                if not self._thread.is_alive():
-                    # after thread closes check if the state (value) has changed
+                # if thread is idle = no timeout
+                if self._idle.wait(timeout=0.2):
+                    # after thread finished the job check if the state (value) has changed
                     if self.dimming.state_before != self.caller.state.current:
                         # Return 'self.caller.state.current' to the caller,
                         # otherwise the new state will not be visible in the calling class
@@ -169,74 +252,87 @@ class _SmoothDimmer():
                       start_delay:float,
                       interval_time:float,
                       value:utils.ColorHSV) -> None:
-        """ Create a new thread to change the PWM in small steps,
-            stop existing thread if present
+        """ Pass a new job to the worker thread to change the PWM in small steps,
+            waits until the current job of the worker thread is finished.
+            The worker thread is created on first use.
 
             This is needed to unblock the calling thread, e. g. to make local
             connections work properly.
         """
-        if isinstance(self._thread, Thread):
-            # make sure thread is not running before starting another one
-            self._thread.join(timeout=None)
-        self._stop_thread = False
-        self._thread = Thread(target=self._smooth_dimmer,
-                              args=(start_delay, interval_time, value))
-        # smooth_dimmer args=       |            |              |
-        #                 start_delay            interval_time  target_value
-        self._thread.start()
+        if not isinstance(self._thread, Thread) or not self._thread.is_alive():
+            # (re)create the worker e. g. if the previous job raised an exception
+            self._thread = Thread(target=self._worker, daemon=True)
+            self._thread.start()
+        # make sure the worker is idle before passing the next job
+        self._idle.wait()
+        self._stop.clear()
+        self._idle.clear()
+        # Pass the current state along, since the caller might replace
+        # self.caller.state.current before the worker starts the job.
+        # Changes made by the worker to this object are visible to the caller,
+        # as long as the caller doesn't replace it (e. g. manual dimming).
+        self._jobs.put((start_delay, interval_time, self.caller.state.current, value))
+
+    def _worker(self) -> None:
+        """ Worker thread, runs the smooth dimmer for every received job
+        """
+        while True:
+            (start_delay, interval_time, current_value, value) = self._jobs.get()
+            try:
+                self._smooth_dimmer(start_delay, interval_time, current_value, value)
+            finally:
+                self._idle.set()
 
     def _smooth_dimmer(self,
                        start_delay:float,
                        interval_time:float,
+                       current_value:utils.ColorHSV,
                        target_value:utils.ColorHSV) -> None:
         """ Change PWM-HAT smoothly to the target_value
 
-        This method is used to create a thread for smoothly changing the PWM when:
+        This method is run by the worker thread for smoothly changing the PWM when:
         * changing to defined set point (start_delay = 0)
         * when manual dimming (start_delay > 0)
 
         Parameter:
             - "start_delay":     Delay in seconds before starting the dimming
-                                (0 = off, 0.1 steps)
+                                (0 = off)
             - "interval_time":   Time in seconds between PWM steps
+            - "current_value":   The ColorHSV class object to start from,
+                                 is changed step by step to the target_value
             - "target_value":    The ColorHSV class object to dim to
         """
         # Manual dimming starts with a delay to ensure
         # that regular toggle commands still get through.
-        waited = 0.0
-        while waited < start_delay and not self._stop_thread:
-            # sleep in 100ms steps to make the start_delay interruptible
-            sleep(0.1)
-            waited += 0.1
-        # Shorten variable name for shorter lines
-        # Since classes copied shallow by default changes made to current_value
-        # are also made to self.caller.state.current
-        current_value = self.caller.state.current
+        # wait() returns immediately when self._stop is set
+        if start_delay and self._stop.wait(start_delay):
+            self.smooth_change.in_progress = False
+            return
+
+        # bind frequently used attributes to locals for the step loop
+        c_val = utils.ColorHSV.C_VAL
+        stop_wait = self._stop.wait
+        set_hsv_all = current_value.set_hsv_all
+        set_pwm = self.set_pwm
 
         # loop until target value is reached or external stop trigger
-        while current_value != target_value and not self._stop_thread:
-            sleep(interval_time)
-            for (param, target) in target_value.hsv_dict.items():
-                if param == utils.ColorHSV.C_HUE:
-                    curr_hue = current_value.get_hsv(utils.ColorHSV.C_HUE)
-                    target_hue = target_value.get_hsv(utils.ColorHSV.C_HUE)
-                    # handle HUE shortcut e. g. value = 300, target = 4 => CCW
-                    current_value.set_hsv(utils.ColorHSV.C_HUE,
-                                          take_radial_step(curr_hue, target_hue, 5))
-                elif abs(current_value.get_hsv(param) - target) < 5:
-                    current_value.set_hsv(param, target)
-                else:
-                    if current_value.get_hsv(param) < target:
-                        current_value.set_hsv(param, current_value.get_hsv(param) + 5)
-                    else:
-                        current_value.set_hsv(param, current_value.get_hsv(param) - 5)
-            self.set_pwm(current_value)
-
-            if start_delay and current_value.get_hsv(utils.ColorHSV.C_VAL) == 0 \
-            and target_value.get_hsv(utils.ColorHSV.C_VAL) == 0:
+        while not self._stop.is_set():
+            # calculate all steps in advance, so the loop below only has to write them
+            trajectory = calc_hsv_trajectory(current_value.get_hsv_all(),
+                                             target_value.get_hsv_all(), 5)
+            for (hue, sat, val) in trajectory:
+                if stop_wait(interval_time):
+                    break
+                set_hsv_all(hue, sat, val)
+                set_pwm(current_value)
+
+            if start_delay and current_value.get_hsv(c_val) == 0 \
+            and target_value.get_hsv(c_val) == 0:
                 # if start_delay > 0 assume manual dimming,
                 # set brightness to 100 for bidirectional dimming
-                target_value.set_hsv(utils.ColorHSV.C_VAL, 100)
+                target_value.set_hsv(c_val, 100)
+            else:
+                break
 
         self.smooth_change.in_progress = False
 
@@ -295,7 +391,7 @@ class PwmHatColorLED(Actuator):
         white_channel_in_use = self.channel[utils.ColorHSV.C_WHITE] != -1
         self.state.current = utils.ColorHSV(dev_cfg_init_state, white_channel_in_use)
         # init last state with configured color and full brightness for toggle command
-        self.state.last = deepcopy(self.state.current)
+        self.state.last = self.state.current.clone()
         self.state.last.set_hsv(utils.ColorHSV.C_VAL, 100)
 
         # If output should be inverted, add -100 to all brightness_rgbw values
@@ -303,10 +399,9 @@ class PwmHatColorLED(Actuator):
 
         # Set up Adafruit PWM HAT
         try:
-            i2c_pins = busio.I2C(board.SCL, board.SDA)
             # Create one own instance of PCA9685 for every actuator,
             # there seams to be no problem with concurrency
-            self.pwm_hat = adafruit_pca9685.PCA9685(i2c_pins, address = self.stack)
+            self.pwm_hat = adafruit_pca9685.PCA9685(i2c_bus(), address = self.stack)
             # Set frequency, all channels share same value
             self.pwm_hat.frequency = int(dev_cfg.get("PWM-Frequency", 240))
         except ValueError as err:
@@ -332,19 +427,61 @@ class PwmHatColorLED(Actuator):
             self.pwm[key].duty_cycle = scale_color_val(self.invert +
                                                        dev_cfg_init_state.get(key, 0))
 
+        # Group channels with consecutive channel numbers, the PCA9685 auto increments
+        # the register address (enabled by adafruit_pca9685 when setting the frequency),
+        # so each group is written in one I2C transaction.
+        # Not configured channels in between are skipped since they might be used
+        # by other actuators on the same HAT.
+        # The groups contain the indexes of the colors in ColorHSV.C_RGBW_ARRAY
+        # to match the result of ColorHSV.get_rgbw_all()
+        self._pwm_groups:List[Tuple[List[int], bytearray]] = []
+        last_ch = -2
+        for key in sorted(self.pwm, key=lambda color: self.channel[color]):
+            if self.channel[key] != last_ch + 1:
+                # buffer for the register address, 4 bytes per channel are appended below
+                self._pwm_groups.append(([],
+                                         bytearray([REG_LED0_ON_L + 4 * self.channel[key]])))
+            (color_indexes, buf) = self._pwm_groups[-1]
+            color_indexes.append(utils.ColorHSV.C_RGBW_ARRAY.index(key))
+            buf.extend(bytes(4))
+            last_ch = self.channel[key]
+        # offset to get the _PWM_REGS_LUT index for a color value, respects invert option
+        lut_offset = self.invert + 100
+
         # define callback method for smooth dimmer thread
-        def set_pwm_value(value:utils.ColorHSV) -> None:
-            for (key, set_point) in value.rgbw_dict.items():
-                if key in self.pwm:
-                    self.pwm[key].duty_cycle = scale_color_val(self.invert + set_point)
+        if len(self.pwm) == 1:
+            # only one channel is defined (dimmer), skip the loops over groups and channels
+            ([single_color_index], single_buf) = self._pwm_groups[0]
+            def set_pwm_value(value:utils.ColorHSV) -> None:
+                regs = _PWM_REGS_LUT[lut_offset + value.get_rgbw_all()[single_color_index]]
+                # the buffer is shared between calls, the bus lock also protects it
+                with self.pwm_hat.i2c_device as i2c:
+                    single_buf[1:5] = regs
+                    i2c.write(single_buf)
+        else:
+            # resolve the position of each channel's registers within the I2C buffer
+            pwm_channels = tuple((tuple((slice(1 + 4 * i, 5 + 4 * i), color_index)
+                                        for (i, color_index) in enumerate(color_indexes)),
+                                  buf)
+                                 for (color_indexes, buf) in self._pwm_groups)
+            def set_pwm_value(value:utils.ColorHSV) -> None:
+                rgbw = value.get_rgbw_all()
+                for (channels, buf) in pwm_channels:
+                    # the buffers are shared between calls, the bus lock also protects them
+                    with self.pwm_hat.i2c_device as i2c:
+                        for (regs, color_index) in channels:
+                            buf[regs] = _PWM_REGS_LUT[lut_offset + rgbw[color_index]]
+                        i2c.write(buf)
         # read settings for the dimmer options, create instance of _SmoothDimmer
         self.dimmer = _SmoothDimmer(caller = self, callback_set_pwm = set_pwm_value)
         self.debounce = utils.Debounce(dev_cfg, default_debounce_time = 0.15)
 
         self.log.info("Configured PWM-HAT %s: Channels: %s",
                       self.name, self.channel)
-        self.log.debug("%s LED's set to: %s and has following configured connections: \n%s",
-                       self.name, self.state.current.rgbw_dict, yaml.dump(self.comm))
+        # skip serializing the config to yaml if it isn't logged anyway
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("%s LED's set to: %s and has following configured connections: \n%s",
+                           self.name, self.state.current.rgbw_dict, yaml.dump(self.comm))
 
         # Publish initial state to cmd_src
         self.publish_actuator_state()
@@ -366,14 +503,50 @@ class PwmHatColorLED(Actuator):
         # currently this is the only way to pass the device_channel_config to homie_conn
         self._register(self.comm, None)
 
-    def on_message(self,
-                   msg:str) -> None:
-        """ Called when the actuator receives a message.
-            Changes LED PWM duty cycle according to the message.
-            Expects comma separated values formated as HSV color: 'h,s,v'
-            OR one value of: ON, OFF, 0 to 100
+    def _cmd_on(self) -> Optional[utils.ColorHSV]:
+        """ Handle openHab item sending ON, set HSV value (brightness) to 100"""
+        new_color:utils.ColorHSV = self.state.current.clone()
+        new_color.set_hsv(utils.ColorHSV.C_VAL, 100)
+        return new_color
+
+    def _cmd_off(self) -> Optional[utils.ColorHSV]:
+        """ Handle openHab item sending OFF, set HSV value (brightness) to 0"""
+        new_color:utils.ColorHSV = self.state.current.clone()
+        new_color.set_hsv(utils.ColorHSV.C_VAL, 0)
+        return new_color
+
+    def _cmd_dim(self) -> Optional[utils.ColorHSV]:
+        """ Handle DIM command, start manual dimming"""
+        self.dimmer.start_dimming()
+        return None
+
+    def _cmd_stop(self) -> Optional[utils.ColorHSV]:
+        """ Handle STOP command, stop manual dimming and publish the new state"""
+        val_changed = self.dimmer.stop_dimming()
+        if val_changed:
+            if self.log.isEnabledFor(logging.INFO):
+                # skip creating the RGBW dictionary if it is not logged
+                self.log.info("%s dimmed PWM-HAT LEDs to %s",
+                              self.name, self.state.current.rgbw_dict)
+            self.publish_actuator_state()
+        return None
+
+    # Handlers for the fixed commands, they return the new color
+    # or None if no further processing is necessary
+    _CMD_HANDLERS:Dict[str, Callable[['PwmHatColorLED'], Optional[utils.ColorHSV]]] = {
+        "ON"   : _cmd_on,
+        "OFF"  : _cmd_off,
+        "DIM"  : _cmd_dim,
+        "STOP" : _cmd_stop
+    }
+
+    def _parse_msg(self,
+                   msg:str) -> Optional[utils.ColorHSV]:
+        """ Parses messages which are not in _CMD_HANDLERS:
+            'h,s,v', 0 to 100 and toggle commands.
+            Returns the new color or None if the message should be ignored
         """
-        new_color = deepcopy(self.state.current)
+        new_color:utils.ColorHSV = self.state.current.clone()
         #if msg.find(',') > 0 and msg.find('NaN') == -1:
         if ',' in msg and not 'NaN' in msg:
             # msg contains ',' so it should contain a 'h,s,v' string
@@ -383,36 +556,17 @@ class PwmHatColorLED(Actuator):
             # msg contains digits convert it from string to int
             # store it as HSV value (brightness)
             new_color.set_hsv(utils.ColorHSV.C_VAL, int(msg))
-        elif msg == "ON":
-            # handle openHab item sending ON
-            # set HSV value (brightness) to 100
-            new_color.set_hsv(utils.ColorHSV.C_VAL, 100)
-        elif msg == "OFF":
-            # handle openHab item sending OFF
-            # set HSV value (brightness) to 0
-            new_color.set_hsv(utils.ColorHSV.C_VAL, 0)
-        elif msg == "DIM":
-            self.dimmer.start_dimming()
-            return
-        elif msg == "STOP":
-            val_changed = self.dimmer.stop_dimming()
-            if val_changed:
-                self.log.info("%s dimmed PWM-HAT LEDs to %s",
-                              self.name, self.state.current.rgbw_dict)
-                self.publish_actuator_state()
-
-            return
         elif utils.is_toggle_cmd(msg):
             if self.debounce.is_within_debounce_time():
                 # Filter close Toggle commands to ensure no double switching
                 self.log.info("%s PWM-HAT channel %s received toggle command %s"
                               " within debounce time. Ignoring command!",
                              self.name, self.channel, msg)
-                return
+                return None
             # invert current state on toggle command
             if self.state.current.get_hsv(utils.ColorHSV.C_VAL) > 0:
                 # remember last value for  brightness for later
-                self.state.last = deepcopy(self.state.current)
+                self.state.last = self.state.current.clone()
                 new_color.set_hsv(utils.ColorHSV.C_VAL, 0)
             else:
                 new_color = self.state.last
@@ -421,31 +575,63 @@ class PwmHatColorLED(Actuator):
             # if command is not recognized ignore it
             self.log.warning("%s  PWM-HAT received unrecognized command %s",
                              self.name, msg)
+            return None
+        return new_color
+
+    def on_message(self,
+                   msg:str) -> None:
+        """ Called when the actuator receives a message.
+            Changes LED PWM duty cycle according to the message.
+            Expects comma separated values formated as HSV color: 'h,s,v'
+            OR one value of: ON, OFF, 0 to 100
+        """
+        # Fast path for command echo which occur with multiple connections:
+        # do nothing when msg equals the published current state, no need to parse it
+        if msg == self._get_state_str():
+            self.log.info("%s PWM-HAT received %s"
+                          " which is equal to current state. Ignoring command!",
+                          self.name, msg)
+            return
+
+        # Look up the fixed commands first, only parse the message if it is none of them
+        handle_cmd = self._CMD_HANDLERS.get(msg)
+        if handle_cmd:
+            new_color = handle_cmd(self)
+        else:
+            new_color = self._parse_msg(msg)
+        if new_color is None:
             return
 
         # do nothing when the command (new_color) equals the current state
         if self.state.current == new_color:
-            self.log.info("%s PWM-HAT received %s"
-                          " which is equal to current state. Ignoring command!",
-                          self.name, new_color.rgbw_dict)
+            if self.log.isEnabledFor(logging.INFO):
+                self.log.info("%s PWM-HAT received %s"
+                              " which is equal to current state. Ignoring command!",
+                              self.name, new_color.rgbw_dict)
             return
 
-        self.log.info("%s received %s, setting LEDs to %s",
-                      self.name, msg, new_color.rgbw_dict)
+        if self.log.isEnabledFor(logging.INFO):
+            # skip creating the RGBW dictionary if it is not logged
+            self.log.info("%s received %s, setting LEDs to %s",
+                          self.name, msg, new_color.rgbw_dict)
 
         self.dimmer.apply_value_change(new_color)
         # Publish own state back to remote connections
         self.state.current = new_color
         self.publish_actuator_state()
 
-    def publish_actuator_state(self) -> None:
-        """ Publishes the current state of the actuator."""
+    def _get_state_str(self) -> str:
+        """ Returns the current state of the actuator as it gets published."""
+        current:utils.ColorHSV = self.state.current
         if len(self.pwm) == 1:
             # if only one channel is defined publish only brightness state
             # to be compatible with openHab dimmer item
-            self._publish(str(self.state.current.get_hsv(utils.ColorHSV.C_VAL)), self.comm)
-            return
-        self._publish(self.state.current.color_hsv_str, self.comm)
+            return str(current.get_hsv(utils.ColorHSV.C_VAL))
+        return current.color_hsv_str
+
+    def publish_actuator_state(self) -> None:
+        """ Publishes the current state of the actuator."""
+        self._publish(self._get_state_str(), self.comm)
 
 
     def cleanup(self) -> None:
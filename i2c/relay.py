@@ -16,8 +16,8 @@
 Classes:
     - EightRelayHAT: switches the corresponding relay.
 """
-from time import sleep
-from distutils.util import strtobool
+import logging
+from threading import Lock, Timer, current_thread
 from typing import Any, Optional, Dict, TYPE_CHECKING
 import yaml
 import lib8relay
@@ -27,6 +27,13 @@ if TYPE_CHECKING:
     # Fix circular imports needed for the type checker
     from core import connection
 
+# relays on the HAT v5.3 are scrambled up, map them correctly
+# there is no relay 0 but indexing starts at zero, first index is a filler
+_RELAY_MAP = (0, 1, 2, 5, 6, 7, 8, 4, 3)
+
+# numeric output state of the ON/OFF commands
+_MSG_TO_INT = {"ON": 1, "OFF": 0}
+
 def onoff_to_str(output:int) -> str:
     """Converts 1 to "ON" and 1 to "OFF"
 
@@ -68,12 +75,10 @@ class EightRelayHAT(Actuator):
         self.stack = dev_cfg.get("Stack", 0)
         self.invert:bool = dev_cfg.get("InvertOut", False)
 
-        # relays on the HAT v5.3 are scrambled up, map them correctly
-        # there is no relay 0 but array indexing starts at zero, first index is a filler
-        relay_map = [0, 1, 2, 5, 6, 7, 8, 4, 3]
-
         self.relay = int(dev_cfg["Relay"])
-        self.mapped_relay = relay_map[self.relay]
+        if self.relay < 1 or self.relay > 8:
+            raise ValueError(f"Unsupported relay number {self.relay}, allowed 1 to 8")
+        self.mapped_relay = _RELAY_MAP[self.relay]
 
         # default state if not configured = False = off
         self.init_state =  dev_cfg.get("InitialState", False)
@@ -87,6 +92,10 @@ class EightRelayHAT(Actuator):
                            self.name, err)
 
         self.sim_button = dev_cfg.get("SimulateButton", False)
+        # timer to release the relay when SimulateButton is enabled
+        self._pulse_timer:Optional[Timer] = None
+        # serializes button press and release, so a running release can't cut a new press short
+        self._pulse_lock = Lock()
 
         # default debounce time 0.15 seconds
         self.debounce = utils.Debounce(dev_cfg, default_debounce_time = 0.15)
@@ -104,8 +113,10 @@ class EightRelayHAT(Actuator):
                       " with SimulateButton %s and InvertOutput %s",
                       self.name, self.stack, self.relay,
                       onoff_to_str(self.current_state), self.sim_button, self.invert)
-        self.log.debug("%s has following configured connections: \n%s",
-                       self.name, yaml.dump(self.comm))
+        # skip serializing the config to yaml if it isn't logged anyway
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("%s has following configured connections: \n%s",
+                           self.name, yaml.dump(self.comm))
 
         # publish initial state back to remote connections
         self.publish_actuator_state()
@@ -128,7 +139,7 @@ class EightRelayHAT(Actuator):
         # ignore this on SimulateButton mode
         if not self.sim_button:
             if msg in ("ON", "OFF"):
-                if self.current_state == strtobool(msg):
+                if self.current_state == _MSG_TO_INT[msg]:
                     self.log.info("%s received command %s"
                                   " which is equal to current output state. Ignoring command!",
                                   self.name, msg)
@@ -153,15 +164,16 @@ class EightRelayHAT(Actuator):
                           self.name, self.stack, self.relay,
                           onoff_to_str(self.init_state),
                           onoff_to_str(not self.init_state))
-            lib8relay.set(self.stack, self.mapped_relay, int(not self.init_state))
-            # "sleep" will block a local connection and therefore
-            # distort the time detection of button press event's
-            sleep(.5)
-            self.log.info("%s toggles Stack %d Relay %d,  %s to %s",
-                          self.name, self.stack, self.relay,
-                          onoff_to_str(not self.init_state),
-                          onoff_to_str(self.init_state))
-            lib8relay.set(self.stack, self.mapped_relay, self.init_state)
+            with self._pulse_lock:
+                if self._pulse_timer is not None:
+                    # button press still in progress, restart the release timer
+                    self._pulse_timer.cancel()
+                lib8relay.set(self.stack, self.mapped_relay, int(not self.init_state))
+                # Release the button after half a second in a separate thread,
+                # "sleep" would block a local connection and therefore
+                # distort the time detection of button press event's
+                self._pulse_timer = Timer(.5, self._release_button)
+                self._pulse_timer.start()
 
         # Turn ON/OFF based on the message.
         else:
@@ -188,6 +200,20 @@ class EightRelayHAT(Actuator):
                 # publish own state back to remote connections
                 self.publish_actuator_state()
 
+    def _release_button(self) -> None:
+        """Sets the relay back to the InitialState, called by the SimulateButton timer.
+        Only the latest timer releases the button, a timer which already fired
+        while a new press restarted the timer does nothing.
+        """
+        with self._pulse_lock:
+            if current_thread() is not self._pulse_timer:
+                return
+            self.log.info("%s toggles Stack %d Relay %d,  %s to %s",
+                          self.name, self.stack, self.relay,
+                          onoff_to_str(not self.init_state),
+                          onoff_to_str(self.init_state))
+            lib8relay.set(self.stack, self.mapped_relay, self.init_state)
+
     def publish_actuator_state(self) -> None:
         """Publishes the current state of the actuator."""
         msg = "ON" if self.current_state else "OFF"
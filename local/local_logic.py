@@ -17,6 +17,9 @@
 Classes: LogicCore, LogicOr
 """
 from abc import abstractmethod
+from functools import partial
+import logging
+import weakref
 import yaml
 from core.actuator import Actuator
 from core.utils import parse_values, is_toggle_cmd, verify_connections_layout, \
@@ -30,12 +33,28 @@ IN_INPUT = "Input"
 LOCAL_CONN_STATE_TOPIC = "StateDest"
 LOCAL_CONN_EQUAL_ATTRIB = "eq"
 
+_DISABLED_MSG = "Actuator is disabled, ignoring command!"
+_FMT_FORWARD = "%s received command %s, from %s, forwarding command '%s'"
+_FMT_IGNORE = "%s received command %s, from %s, output %s doesn't change, ignoring command!"
+
+def _call_weak_method(weak_method, *args, **kwargs):
+    """Calls the method referenced by weak_method, if its instance still exists.
+    Used as message handler, so the connections don't keep the logic actuator alive.
+    """
+    method = weak_method()
+    if method is not None:
+        method(*args, **kwargs)
+
+
 class LogicCore(Actuator):
     """Class from which all local logic capabilities must inherit. Is assumes there
     is a "InputSrc" param and automatically registers to subscribe to that topic
     with all of the passed in connections. A default implementation is provided
     for all but the process_message method which must be overridden.
     """
+    # Actuator has no __slots__, so only the attributes added here are stored in slots
+    __slots__ = ("enabled", "values", "on_msg", "off_msg", "local_conns", "known_inputs")
+
     def __init__(self, connections, dev_cfg):
         """Initializes the Actuator by storing the passed in arguments as data
         members and registers to subscribe to params("InputSrc").
@@ -49,32 +68,49 @@ class LogicCore(Actuator):
 
         self.enabled = True
         self.values = parse_values(self, self.connections, ["ON", "OFF"])
-
+        #the values don't change at runtime, so prepare the value_dicts to publish once
+        self.on_msg = get_msg_from_values(self.values, True)
+        self.off_msg = get_msg_from_values(self.values, False)
+        #connections don't change at runtime, so look up the local ones (attrib eq) only once
+        self.local_conns = [conn for conn in self.comm
+                            if hasattr(self.connections[conn], LOCAL_CONN_EQUAL_ATTRIB)]
 
         self.known_inputs = []
+        #register weak references only, to avoid reference cycles between
+        #the connections and this actuator
+        weak_dispatch = weakref.WeakMethod(self._dispatch)
         #grab inputs and register them one by one
         for (conn, subdict) in self.comm.items():
+            connection = self.connections[conn]
             #grab EnableSrc subdictionary and register
             if IN_ENABLE_SRC in subdict:
-                self.connections[conn].register(subdict[IN_ENABLE_SRC], self.on_message)
+                connection.register(subdict[IN_ENABLE_SRC],
+                                    partial(_call_weak_method,
+                                            weakref.WeakMethod(self.on_message)))
             #grab InputSrc and register them one by one
             if IN_INPUT in subdict:
                 for (param_name, src_list) in subdict[IN_INPUT].items():
                     # make sure we got the list containing the InputSrc
                     if isinstance(src_list, list):
                         for src in src_list:
-                            def create_msg_handler(conn_src= conn + '_' + src,
-                                                    l_conn = conn, l_param_name = param_name,
-                                                    l_src = src):
-                                self.known_inputs.append(conn_src)
-                                def msg_handler(msg):
-                                    if self.enabled:
-                                        self.process_message(msg, conn_src)
-                                    else:
-                                        self.log.info("Actuator is disabled, ignoring command!")
-                                self.connections[l_conn].register( {l_param_name : l_src },
-                                                                   msg_handler)
-                            create_msg_handler()
+                            conn_src = conn + '_' + src
+                            self.known_inputs.append(conn_src)
+                            connection.register({param_name : src},
+                                                partial(_call_weak_method, weak_dispatch,
+                                                        src=conn_src))
+
+    def _dispatch(self, msg, src):
+        """Forwards a message from a registered 'InputSrc' to process_message
+        if the logic actuator is enabled
+
+        Arguments:
+            - msg : the message from the 'InputSrc'
+            - src : the name of the calling 'InputSrc'
+        """
+        if self.enabled:
+            self.process_message(msg, src)
+        elif self.log.isEnabledFor(logging.INFO):
+            self.log.info(_DISABLED_MSG)
 
     def _register(self, comm, handler):
         """override register of parent so super().__init__ won't try to register any handler
@@ -107,19 +143,43 @@ class LogicCore(Actuator):
         if not isinstance(message, dict):
             msg = message
 
-        for conn in comm.keys():
+        #only publish to local connections (attrib eq)
+        for conn in self.local_conns:
+            if conn not in comm:
+                continue
             #if message is a value_dict from get_msg_from_values, grab the current conn message
-            #use list in default section if conn section is not present 
+            #use list in default section if conn section is not present
             if isinstance(message, dict):
                 msg = message.get(conn, message[DEFAULT_SECTION])
-            #only publish to local connections (attrib eq)
-            if hasattr(self.connections[conn], LOCAL_CONN_EQUAL_ATTRIB):
-                self.connections[conn].publish(msg, comm[conn], output_name)
+            self.connections[conn].publish(msg, comm[conn], output_name)
+
+    def _publish_outputs(self, message, outputs):
+        """Protected method that will publish the passed in message to all passed in
+        outputs, each local connection is visited only once.
+
+        Arguments:
+            - message : the message to publish or a value_dict from get_msg_from_values
+            - outputs : dictionary of local connection names,
+                        each containing a list of the output names to publish to
+        """
+        for (conn, output_names) in outputs.items():
+            #if message is a value_dict from get_msg_from_values, grab the current conn message
+            #use list in default section if conn section is not present
+            if isinstance(message, dict):
+                msg = message.get(conn, message[DEFAULT_SECTION])
+            else:
+                msg = message
+            publish = self.connections[conn].publish
+            comm_conn = self.comm[conn]
+            for output_name in output_names:
+                publish(msg, comm_conn, output_name)
 
 class LogicOr (LogicCore):
     """Logical OR gate, can receive from multiple sensors
     and will trigger all configured receivers
     """
+    __slots__ = ("outputs", "src_bit", "single_input", "state_mask", "output_activ")
+
     def __init__(self, connections, dev_cfg):
         """Initializes the Actuator by storing the passed in arguments as data
         members and registers 'InputSrc' and 'EnableSrc' with the given connections
@@ -141,31 +201,33 @@ class LogicOr (LogicCore):
         verify_connections_layout(self.comm, self.log, self.name,
                                   [IN_INPUT, IN_ENABLE_SRC, OUT_DEST])
 
-        self.src_is_on = {}
         #split output list to subdicts if it's a local connection (attrib eq)
+        #remember the output names of each connection, so they can be published in one go
+        self.outputs = {}
         count_outputs = 1
-        for (conn, subdict) in self.comm.items():
-            #check if it is a local connection
-            if hasattr(self.connections[conn], LOCAL_CONN_EQUAL_ATTRIB):
-                if OUT_DEST in subdict:
-                    #assume the params 'StateDest' is present,
-                    # since we checked it is a local connection
-                    for out in subdict[OUT_DEST][LOCAL_CONN_STATE_TOPIC]:
-                        self.comm[conn][OUT_DEST + str(count_outputs)] = {}
-                        self.comm[conn][OUT_DEST + str(count_outputs)][LOCAL_CONN_STATE_TOPIC] = out
-                        count_outputs += 1
-        self.count_outs = count_outputs
+        for conn in self.local_conns:
+            subdict = self.comm[conn]
+            if OUT_DEST in subdict:
+                output_names = []
+                #assume the params 'StateDest' is present,
+                # since we checked it is a local connection
+                for out in subdict[OUT_DEST][LOCAL_CONN_STATE_TOPIC]:
+                    output_name = OUT_DEST + str(count_outputs)
+                    subdict[output_name] = {LOCAL_CONN_STATE_TOPIC : out}
+                    output_names.append(output_name)
+                    count_outputs += 1
+                self.outputs[conn] = output_names
         #delet old items
-        for (conn, subdict) in self.comm.items():
-            if hasattr(self.connections[conn], LOCAL_CONN_EQUAL_ATTRIB):
-                if OUT_DEST in subdict:
-                    del self.comm[conn][OUT_DEST]
+        for conn in self.local_conns:
+            if OUT_DEST in self.comm[conn]:
+                del self.comm[conn][OUT_DEST]
 
-        self.src_is_on = {}
-        for src in self.known_inputs:
-            self.src_is_on[src] = False
+        # assign one bit per InputSrc, the bits of the InputSrc which are ON are set in state_mask
+        self.src_bit = {src: 1 << index for (index, src) in enumerate(self.known_inputs)}
+        self.state_mask = 0
+        # with a single InputSrc the output simply follows the input
+        self.single_input = len(self.src_bit) == 1
         self.output_activ = False
-        self.last_output_state = False
 
         ### homie connector is currently not supported ( homie connector can't handle input channel names )
         # #configure_output for homie etc. after debug output, so self.comm is clean
@@ -183,24 +245,46 @@ class LogicOr (LogicCore):
             - msg : the message from the 'InputSrc'
             - src : the name of the calling 'InputSrc'
         """
-        self.last_output_state = self.output_activ
+        last_output_state = self.output_activ
 
         if is_toggle_cmd(msg):
             self.output_activ = not self.output_activ
+        elif self.single_input:
+            self.output_activ = (msg == "ON")
         else:
-            self.src_is_on[src] = (msg == "ON")
+            # every InputSrc has its own bit in state_mask, set it if the InputSrc is ON
+            if msg == "ON":
+                state_mask = self.state_mask | self.src_bit[src]
+            else:
+                state_mask = self.state_mask & ~self.src_bit[src]
+
+            # InputSrc resends its state and the output wasn't toggled since, nothing to do
+            if state_mask == self.state_mask and self.output_activ == (state_mask != 0):
+                self._log_ignored(msg, src)
+                return
+            self.state_mask = state_mask
 
             # if all InputSrc are OFF -> False
             # else -> True
-            self.output_activ = bool(sum(self.src_is_on.values()))
+            self.output_activ = self.state_mask != 0
 
-        output = get_msg_from_values(self.values, self.output_activ)
-        if self.last_output_state != self.output_activ:
-            self.log.info("%s received command %s, from %s, forwarding command '%s'",
-                           self.name, msg, src, output[DEFAULT_SECTION])
+        if last_output_state == self.output_activ:
+            self._log_ignored(msg, src)
+            return
 
-            for dest_num in range(1, self.count_outs):
-                self._publish(output, self.comm, OUT_DEST + str(dest_num))
-        else:
-            self.log.info("%s received command %s, from %s, output %s doesn't change,"
-                          " ignoring command!", self.name, msg, src, output[DEFAULT_SECTION])
+        output = self.on_msg if self.output_activ else self.off_msg
+        if self.log.isEnabledFor(logging.INFO):
+            self.log.info(_FMT_FORWARD, self.name, msg, src, output[DEFAULT_SECTION])
+
+        self._publish_outputs(output, self.outputs)
+
+    def _log_ignored(self, msg, src):
+        """Logs that the message from the 'InputSrc' doesn't change the output
+
+        Arguments:
+            - msg : the message from the 'InputSrc'
+            - src : the name of the calling 'InputSrc'
+        """
+        if self.log.isEnabledFor(logging.INFO):
+            output = self.on_msg if self.output_activ else self.off_msg
+            self.log.info(_FMT_IGNORE, self.name, msg, src, output[DEFAULT_SECTION])